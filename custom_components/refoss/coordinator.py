@@ -32,6 +32,8 @@ class RefossDataUpdateCoordinator(DataUpdateCoordinator[None]):
         )
         self.device = device
         self._error_count = 0
+        self.monthly_energy_file_path = f"/config/em/{device.dev_name}_monthly_energy.json"
+        self.daily_energy_file_path = f"/config/em/{device.dev_name}_daily_energy.json"
 
     async def _async_update_data(self) -> None:
         """Update the state of the device."""
@@ -3,15 +3,12 @@
 from __future__ import annotations
 
 import os
-import json
 import datetime
-import asyncio
 
 from collections.abc import Callable
 from dataclasses import dataclass
 
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+import orjson
 
 from refoss_ha.controller.electricity import ElectricityXMix
 
@@ -28,8 +25,11 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfPower,
 )
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import (
+    async_track_time_change,
+    async_track_time_interval,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
@@ -46,12 +46,54 @@ from .const import (
 from .entity import RefossEntity
 
 
+def _write_json(file_path: str, data: dict) -> None:
+    """Atomically write JSON data to a file (runs in the executor).
+
+    The payload goes to a fsynced temporary file that is renamed over the
+    target, so a crash or power loss mid-write cannot leave a truncated
+    file that load would later replace with zeroed values.
+    """
+    payload = orjson.dumps(
+        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    )
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(payload)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, file_path)
+
+
+def _read_json(file_path: str) -> dict:
+    """Read JSON data from a file (runs in the executor)."""
+    with open(file_path, "rb") as file:
+        return orjson.loads(file.read())
+
+
+def _read_energy_file(file_path: str) -> dict[int, float]:
+    """Read an energy file, converting the channel keys back to int.
+
+    Raises ValueError when the file does not hold an object keyed by
+    channel numbers, so callers fall back to their defaults the same way
+    they do for unparseable JSON.
+    """
+    data = _read_json(file_path)
+    if not isinstance(data, dict):
+        raise ValueError(f"{file_path} does not contain a JSON object")
+    return {int(channel): value for channel, value in data.items()}
+
+
+def _div1000(value: float) -> float:
+    """Convert a milli-scaled reading to its base unit."""
+    return value / 1000.0
+
+
 @dataclass(frozen=True, kw_only=True)
 class RefossSensorEntityDescription(SensorEntityDescription):
     """Describes Refoss sensor entity."""
 
     subkey: str
-    fn: Callable[[float], float] = lambda x: x
+    fn: Callable[[float], float] | None = None
 
 
 DEVICETYPE_SENSOR: dict[str, str] = {
@@ -69,7 +111,7 @@ SENSORS: dict[str, tuple[RefossSensorEntityDescription, ...]] = {
             native_unit_of_measurement=UnitOfPower.WATT,
             suggested_display_precision=2,
             subkey="power",
-            fn=lambda x: x / 1000.0,
+            fn=_div1000,
         ),
         RefossSensorEntityDescription(
             key="voltage",
@@ -107,7 +149,6 @@ SENSORS: dict[str, tuple[RefossSensorEntityDescription, ...]] = {
             native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
             suggested_display_precision=2,
             subkey="mConsume",
-            fn=lambda x: x,
         ),
         RefossSensorEntityDescription(
             key="this_day_energy",
@@ -117,11 +158,100 @@ SENSORS: dict[str, tuple[RefossSensorEntityDescription, ...]] = {
             native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
             suggested_display_precision=2,
             subkey="mConsume",
-            fn=lambda x: x,
         ),
     ),
 }
 
+# Entity build specs per (device_type, channels) pair, cached because the
+# channel x description cross-product is identical for every device of a type.
+_ENTITY_SPECS: dict[
+    tuple[str, tuple[int, ...]],
+    tuple[tuple[int, str, RefossSensorEntityDescription], ...],
+] = {}
+
+# Per-description constants read on every native_value call, precomputed
+# once so the hot path avoids repeated EntityDescription attribute lookups.
+_DESC_INDEX: dict[str, tuple[str, Callable[[float], float] | None, bool, bool]] = {
+    description.key: (
+        description.subkey,
+        description.fn,
+        description.translation_key == "this_day_energy",
+        description.translation_key == "this_month_energy",
+    )
+    for descriptions in SENSORS.values()
+    for description in descriptions
+}
+
+
+def _ensure_file_exists(device: ElectricityXMix, file_path: str, use_sensor_values: bool = False) -> None:
+    """Ensure the JSON file exists, creating it with appropriate initial values."""
+    try:
+        # O_EXCL creates the file in a single syscall and fails if it already
+        # exists, instead of a separate stat followed by a racy open("w").
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return
+    except IOError as e:
+        _LOGGER.error("Failed to create energy data file: %s", e)
+        return
+
+    try:
+        with os.fdopen(fd, "wb") as file:
+            if use_sensor_values:
+                # ✅ 현재 센서 값 (기기값) + 월사용량 값 저장 (daily_energy.json)
+                default_data = {}
+                for channel in device.channels:
+                    device_value = device.get_value(channel, "mConsume") or 0
+                    stored_value = RefossSensor._cached_monthly_energy_data.get(channel, 0)  # ✅ 월사용량 값 가져오기
+                    default_data[channel] = device_value + stored_value  # ✅ 기기값 + 월사용량 값 저장
+            else:
+                # ✅ 모든 채널 값을 0으로 설정 (monthly_energy.json)
+                default_data = {channel: 0 for channel in device.channels}
+
+            file.write(
+                orjson.dumps(
+                    default_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            )
+
+        _LOGGER.info("Created new energy data file: %s with %s",
+                     file_path, "sensor values (device + monthly)" if use_sensor_values else "zero values")
+
+    except IOError as e:
+        _LOGGER.error("Failed to create energy data file: %s", e)
+
+
+def _load_energy_data(device: ElectricityXMix, file_path: str) -> None:
+    """Load stored energy data from JSON file into the monthly cache."""
+    try:
+        RefossSensor._cached_monthly_energy_data = _read_energy_file(file_path)
+        RefossSensor._file_mtimes[file_path] = os.stat(file_path).st_mtime_ns
+        _LOGGER.info("Loaded stored energy data from %s", file_path)
+    except (IOError, ValueError):
+        _LOGGER.error("Failed to read energy data file. Using default values.")
+        # ✅ JSON 파일이 없거나 손상된 경우, 현재 기기의 채널 개수를 기반으로 기본값 설정
+        RefossSensor._cached_monthly_energy_data = {channel: 0 for channel in device.channels}
+
+
+def _load_daily_energy_data(device: ElectricityXMix, file_path: str) -> None:
+    """Load stored daily energy data from JSON file into the daily cache."""
+    try:
+        RefossSensor._cached_daily_energy_data = _read_energy_file(file_path)
+        RefossSensor._file_mtimes[file_path] = os.stat(file_path).st_mtime_ns
+        _LOGGER.info("Loaded daily energy data from %s", file_path)
+    except (IOError, ValueError):
+        _LOGGER.error("Failed to read daily energy data file. Using default values.")
+        RefossSensor._cached_daily_energy_data = {channel: 0 for channel in device.channels}
+
+
+def _prepare_energy_files(device: ElectricityXMix, monthly_path: str, daily_path: str) -> None:
+    """Create and load both energy files for a device (runs in the executor)."""
+    _ensure_file_exists(device, monthly_path, use_sensor_values=False)  # ✅ 0으로 저장 (monthly_energy.json)
+    _ensure_file_exists(device, daily_path, use_sensor_values=True)  # ✅ 센서값 저장 (daily_energy.json)
+
+    _load_energy_data(device, monthly_path)
+    _load_daily_energy_data(device, daily_path)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -133,15 +263,14 @@ async def async_setup_entry(
     user_reset_day = config_entry.data.get("user_reset_day", 24)
     device_reset_day = config_entry.data.get("device_reset_day", 1)
 
-    async def save_user_reset(_):
-        """Save energy consumption data at the specified time (24일 09:30:30)."""
+    async def save_user_reset(now):
+        """Save inverted energy consumption data on the user reset day."""
         for coordinator in hass.data[DOMAIN][COORDINATORS]:
             device = coordinator.device
             if not isinstance(device, ElectricityXMix):
                 continue
 
-            device_name = device.dev_name
-            file_path = f"/config/em/{device_name}_monthly_energy.json"
+            file_path = coordinator.monthly_energy_file_path
 
             energy_data = {}
             for channel in device.channels:
@@ -149,172 +278,171 @@ async def async_setup_entry(
                 energy_data[channel] = (-1 * device_value) if device_value is not None else 0  # ✅ -1 곱해서 저장
 
             try:
-                with open(file_path, "w", encoding="utf-8") as file:
-                    json.dump(energy_data, file, indent=4)
-                _LOGGER.info("Saved monthly energy data (inverted) for device %s", device_name)
+                await hass.async_add_executor_job(_write_json, file_path, energy_data)
+                _LOGGER.info("Saved monthly energy data (inverted) for device %s", device.dev_name)
             except IOError as e:
                 _LOGGER.error("Failed to save monthly energy data: %s", e)
-                
-        await asyncio.sleep(3)  # ✅ 실행 후 3초 대기 (중복 실행 방지)
-        schedule_user_reset()
 
-    async def save_device_reset(_):
-        """Save adjusted energy data at the specified time (28일 08:30:30)."""
+    async def save_device_reset(now):
+        """Save adjusted energy data on the device reset day."""
         for coordinator in hass.data[DOMAIN][COORDINATORS]:
             device = coordinator.device
             if not isinstance(device, ElectricityXMix):
                 continue
 
-            device_name = device.dev_name
-            file_path = f"/config/em/{device_name}_monthly_energy.json"
+            file_path = coordinator.monthly_energy_file_path
 
             energy_data = {}
             for channel in device.channels:
                 # ✅ 센서 값 (기기 값 + 기존 파일 값) 저장
                 device_value = device.get_value(channel, "mConsume") or 0
-                stored_value = RefossSensor._cached_monthly_energy_data.get(str(channel), 0)
+                stored_value = RefossSensor._cached_monthly_energy_data.get(channel, 0)
                 adjusted_value = device_value + stored_value  # ✅ 센서 값으로 저장
 
                 energy_data[channel] = adjusted_value
 
             try:
-                with open(file_path, "w", encoding="utf-8") as file:
-                    json.dump(energy_data, file, indent=4)
-                _LOGGER.info("Saved adjusted energy data for device %s", device_name)
+                await hass.async_add_executor_job(_write_json, file_path, energy_data)
+                _LOGGER.info("Saved adjusted energy data for device %s", device.dev_name)
             except IOError as e:
                 _LOGGER.error("Failed to save adjusted energy data: %s", e)
 
-        await asyncio.sleep(3)  # ✅ 실행 후 3초 대기 (중복 실행 방지)
-        schedule_device_reset()
-
-    async def save_daily_energy(_):
+    async def save_daily_energy(now):
         """Save daily energy consumption at midnight and update daily usage."""
-        now = datetime.datetime.now()  #아래 user_reset_day 비교 때문에 필요
         for coordinator in hass.data[DOMAIN][COORDINATORS]:
             device = coordinator.device
             if not isinstance(device, ElectricityXMix):
                 continue
-    
-            device_name = device.dev_name
-            file_path = f"/config/em/{device_name}_daily_energy.json"
-    
+
+            file_path = coordinator.daily_energy_file_path
+
             daily_energy_data = {}
-    
+
             # ✅ 현재 센서 값을 가져와서 저장
             for channel in device.channels:
                 device_value = device.get_value(channel, "mConsume") or 0 #기기값
-                stored_value = RefossSensor._cached_monthly_energy_data.get(str(channel), 0) #월저장 파일값
+                stored_value = RefossSensor._cached_monthly_energy_data.get(channel, 0) #월저장 파일값
                 adjusted_value = device_value + stored_value  # ✅ 월사용량(기기+파일)
-                
+
                 if now.day == user_reset_day:
                     daily_energy_data[channel] = 0
                 else:
                     daily_energy_data[channel] = adjusted_value
-                    
-                RefossSensor._cached_daily_energy_data[str(channel)] = adjusted_value  # ✅ 캐시 업데이트
-                
+
+                RefossSensor._cached_daily_energy_data[channel] = adjusted_value  # ✅ 캐시 업데이트
+
             # ✅ 기존 파일 업데이트
             try:
-                with open(file_path, "w", encoding="utf-8") as file:
-                    json.dump(daily_energy_data, file, indent=4)
-                _LOGGER.info("Updated daily energy file for device %s", device_name)
+                await hass.async_add_executor_job(_write_json, file_path, daily_energy_data)
+                _LOGGER.info("Updated daily energy file for device %s", device.dev_name)
             except IOError as e:
                 _LOGGER.error("Failed to update daily energy file: %s", e)
-    
-        await asyncio.sleep(3)  # ✅ 실행 후 3초 대기 (중복 실행 방지)
-        schedule_daily_energy_save()
-    
-    def schedule_user_reset():
-        """사용자 지정 리셋"""
-        now = datetime.datetime.now()
-        target_time = now.replace(day=user_reset_day, hour=0, minute=0, second=0)
-
-        if now > target_time:
-            target_time = target_time.replace(month=(now.month % 12) + 1, year=now.year + (1 if now.month == 12 else 0))
-
-        _LOGGER.info("Next energy data save scheduled at: %s", target_time)
-        async_track_point_in_time(hass, save_user_reset, target_time)
-
-    def schedule_device_reset():
-        """Refoss 자체 리렛"""
-        now = datetime.datetime.now()
-        target_time = now.replace(day=device_reset_day, hour=0, minute=0, second=0)
-
-        if now > target_time:
-            target_time = target_time.replace(month=(now.month % 12) + 1, year=now.year + (1 if now.month == 12 else 0))
-            
-        target_time = target_time - datetime.timedelta(seconds=1)
-
-        _LOGGER.info("Next adjusted energy data save scheduled at: %s", target_time)
-        async_track_point_in_time(hass, save_device_reset, target_time)
-
-    def schedule_daily_energy_save():
-        """Schedule daily energy saving at 00:00:01."""
-        now = datetime.datetime.now()
-        target_time = now.replace(hour=0, minute=0, second=1)
-    
-        if now > target_time:
-            target_time = target_time + datetime.timedelta(days=1)
-    
-        _LOGGER.info("Next daily energy save scheduled at: %s", target_time)
-        async_track_point_in_time(hass, save_daily_energy, target_time)
-        
-    schedule_user_reset()
-    schedule_device_reset()
-    schedule_daily_energy_save()
 
+    async def _midnight_saves(now):
+        """Run the daily save and any monthly resets due today."""
+        await save_daily_energy(now)
+
+        if now.day == user_reset_day:
+            await save_user_reset(now)
+
+        if now.day == device_reset_day:
+            await save_device_reset(now)
+
+    config_entry.async_on_unload(
+        async_track_time_change(hass, _midnight_saves, hour=0, minute=0, second=0)
+    )
+
+    async def _maybe_reload_energy_files(_=None):
+        """Reload the energy caches when a file changed on disk."""
+        for coordinator in hass.data[DOMAIN][COORDINATORS]:
+            device = coordinator.device
+            if not isinstance(device, ElectricityXMix):
+                continue
+
+            for file_path, cache_attr in (
+                (coordinator.monthly_energy_file_path, "_cached_monthly_energy_data"),
+                (coordinator.daily_energy_file_path, "_cached_daily_energy_data"),
+            ):
+                try:
+                    stat = await hass.async_add_executor_job(os.stat, file_path)
+                except OSError:
+                    continue
+                if RefossSensor._file_mtimes.get(file_path) == stat.st_mtime_ns:
+                    continue
+
+                try:
+                    data = await hass.async_add_executor_job(_read_energy_file, file_path)
+                except (IOError, ValueError):
+                    _LOGGER.error("Failed to reload energy data file %s", file_path)
+                    continue
+
+                RefossSensor._file_mtimes[file_path] = stat.st_mtime_ns
+                setattr(RefossSensor, cache_attr, data)
+                _LOGGER.info("Detected change in %s, reloaded energy data", file_path)
+
+    config_entry.async_on_unload(
+        async_track_time_interval(
+            hass, _maybe_reload_energy_files, datetime.timedelta(seconds=30)
+        )
+    )
+
+    initialized_coordinators: set[int] = set()
 
-    @callback
-    def init_device(coordinator: RefossDataUpdateCoordinator) -> None:
+    async def init_device(coordinator: RefossDataUpdateCoordinator) -> None:
         """Register the device."""
         device = coordinator.device
 
         if not isinstance(device, ElectricityXMix):
             return
 
-        sensor_type = DEVICETYPE_SENSOR.get(device.device_type, "")
+        # The discovery signal can re-announce a known device; registering
+        # it again would re-run the file setup and create duplicate entities.
+        if id(coordinator) in initialized_coordinators:
+            return
+        initialized_coordinators.add(id(coordinator))
 
-        descriptions: tuple[RefossSensorEntityDescription, ...] = SENSORS.get(
-            sensor_type, ()
+        await hass.async_add_executor_job(
+            _prepare_energy_files,
+            device,
+            coordinator.monthly_energy_file_path,
+            coordinator.daily_energy_file_path,
         )
 
+        spec_key = (device.device_type, tuple(device.channels))
+        specs = _ENTITY_SPECS.get(spec_key)
+        if specs is None:
+            sensor_type = DEVICETYPE_SENSOR.get(device.device_type, "")
+
+            descriptions: tuple[RefossSensorEntityDescription, ...] = SENSORS.get(
+                sensor_type, ()
+            )
+
+            aliases = CHANNEL_DISPLAY_NAME.get(device.device_type, {})
+
+            specs = _ENTITY_SPECS[spec_key] = tuple(
+                (channel, aliases.get(channel, f"ch{channel}"), description)
+                for channel in device.channels
+                for description in descriptions
+            )
+
         async_add_entities(
             RefossSensor(
                 coordinator=coordinator,
                 channel=channel,
+                channel_alias=channel_alias,
                 description=description,
             )
-            for channel in device.channels
-            for description in descriptions
+            for channel, channel_alias, description in specs
         )
         _LOGGER.debug("Device %s add sensor entity success", device.dev_name)
 
     for coordinator in hass.data[DOMAIN][COORDINATORS]:
-        init_device(coordinator)
+        await init_device(coordinator)
 
     config_entry.async_on_unload(
         async_dispatcher_connect(hass, DISPATCH_DEVICE_DISCOVERED, init_device)
     )
-
-
-class EnergyFileWatcher(FileSystemEventHandler):
-    """Watch for changes in the energy JSON files and reload data."""
-
-    def __init__(self, sensor_instance, file_paths):
-        """Initialize the file watcher for multiple files."""
-        self._sensor_instance = sensor_instance
-        self._file_paths = set(file_paths)  # ✅ 여러 개의 파일 감시 가능하도록 변경
-
-    def on_modified(self, event):
-        """Handle file modifications."""
-        if event.src_path in self._file_paths:
-            _LOGGER.info("Detected change in %s, reloading energy data.", event.src_path)
-
-            # ✅ 파일 이름에 따라 적절한 로드 함수 호출
-            if event.src_path.endswith("_daily_energy.json"):
-                self._sensor_instance.load_daily_energy_data()
-            elif event.src_path.endswith("_monthly_energy.json"):
-                self._sensor_instance.load_energy_data()
+    config_entry.async_on_unload(initialized_coordinators.clear)
 
 
 class RefossSensor(RefossEntity, SensorEntity):
@@ -323,103 +451,41 @@ class RefossSensor(RefossEntity, SensorEntity):
     entity_description: RefossSensorEntityDescription
     _cached_monthly_energy_data = {}
     _cached_daily_energy_data = {}
-    _observer = None
-    
+    _file_mtimes: dict[str, int] = {}
+
     def __init__(
         self,
         coordinator: RefossDataUpdateCoordinator,
         channel: int,
+        channel_alias: str,
         description: RefossSensorEntityDescription,
     ) -> None:
         """Init Refoss sensor."""
         super().__init__(coordinator, channel)
         self.entity_description = description
-        device_type = self.coordinator.device.device_type
-        channel_alias = CHANNEL_DISPLAY_NAME.get(device_type, {}).get(channel, f"ch{channel}")
         self._attr_unique_id = f"{channel_alias}_{description.translation_key}"
         self._attr_name = f"{channel_alias}_{description.translation_key}"
 
-        self.monthly_energy_file_path = f"/config/em/{self.coordinator.device.dev_name}_monthly_energy.json"
-        self.daily_energy_file_path = f"/config/em/{self.coordinator.device.dev_name}_daily_energy.json"
-        
-        self.ensure_file_exists(self.monthly_energy_file_path, use_sensor_values=False)  # ✅ 0으로 저장 (monthly_energy.json)
-        self.ensure_file_exists(self.daily_energy_file_path, use_sensor_values=True)  # ✅ 센서값 저장 (daily_energy.json)
-
-        self.load_energy_data()
-        self.load_daily_energy_data()
-        self.start_watching_file()
-        
-    def ensure_file_exists(self, file_path, use_sensor_values=False):
-        """Ensure the JSON file exists, creating it with appropriate initial values."""
-        if not os.path.exists(file_path):
-            try:
-                if use_sensor_values:
-                    # ✅ 현재 센서 값 (기기값) + 월사용량 값 저장 (daily_energy.json)
-                    default_data = {}
-                    for channel in self.coordinator.device.channels:
-                        device_value = self.coordinator.device.get_value(channel, "mConsume") or 0
-                        stored_value = RefossSensor._cached_monthly_energy_data.get(str(channel), 0)  # ✅ 월사용량 값 가져오기
-                        default_data[str(channel)] = device_value + stored_value  # ✅ 기기값 + 월사용량 값 저장
-                else:
-                    # ✅ 모든 채널 값을 0으로 설정 (monthly_energy.json)
-                    default_data = {str(channel): 0 for channel in self.coordinator.device.channels}
-    
-                with open(file_path, "w", encoding="utf-8") as file:
-                    json.dump(default_data, file, indent=4)
-    
-                _LOGGER.info("Created new energy data file: %s with %s", 
-                             file_path, "sensor values (device + monthly)" if use_sensor_values else "zero values")
-    
-            except IOError as e:
-                _LOGGER.error("Failed to create energy data file: %s", e)
-
-
-                
-    def load_energy_data(self):
-        """Load stored energy data from JSON file."""
-        try:
-            with open(self.monthly_energy_file_path, "r", encoding="utf-8") as file:
-                RefossSensor._cached_monthly_energy_data = json.load(file)
-            _LOGGER.info("Loaded stored energy data from %s", self.monthly_energy_file_path)
-        except (IOError, json.JSONDecodeError):
-            _LOGGER.error("Failed to read energy data file. Using default values.")
-            # ✅ JSON 파일이 없거나 손상된 경우, 현재 기기의 채널 개수를 기반으로 기본값 설정
-            RefossSensor._cached_monthly_energy_data = {str(channel): 0 for channel in self.coordinator.device.channels}
-
-    def load_daily_energy_data(self):
-        """Load stored daily energy data from JSON file into cache."""
-        try:
-            with open(self.daily_energy_file_path, "r", encoding="utf-8") as file:
-                RefossSensor._cached_daily_energy_data = json.load(file)
-            _LOGGER.info("Loaded daily energy data from %s", self.daily_energy_file_path)
-        except (IOError, json.JSONDecodeError):
-            _LOGGER.error("Failed to read daily energy data file. Using default values.")
-            RefossSensor._cached_daily_energy_data = {str(channel): 0 for channel in self.coordinator.device.channels}
-
-    def start_watching_file(self):
-        """Start watching the energy JSON files for changes (only once)."""
-        if RefossSensor._observer is not None:
-            return  # ✅ 이미 감시 중이면 실행하지 않음
-            
-        file_paths = [self.monthly_energy_file_path, self.daily_energy_file_path]
-        event_handler = EnergyFileWatcher(self, file_paths)
-        
-        RefossSensor._observer = Observer()
-        RefossSensor._observer.schedule(event_handler, os.path.dirname(self.monthly_energy_file_path), recursive=False)
-        RefossSensor._observer.start()
-        _LOGGER.info("Started watching files: %s", file_paths)
+        self._subkey, self._fn, self._is_daily, self._is_monthly = _DESC_INDEX[
+            description.key
+        ]
 
     @property
     def native_value(self) -> StateType:
         """Return the native value including stored energy data."""
-        device_value = self.coordinator.device.get_value(self.channel_id, self.entity_description.subkey) or 0 #기기값
-        daily_stored_value = RefossSensor._cached_daily_energy_data.get(str(self.channel_id), 0) #일저장 파일값
-        monthly_stored_value = RefossSensor._cached_monthly_energy_data.get(str(self.channel_id), 0) #월저장 파일값
-    
-        if self.entity_description.translation_key == "this_day_energy":
-            return self.entity_description.fn(device_value + monthly_stored_value - daily_stored_value)  # ✅ 일사용량 센서
-    
-        if self.entity_description.translation_key == "this_month_energy":
-            return self.entity_description.fn(device_value + monthly_stored_value)  # ✅ 월사용량 센서
-    
-        return self.entity_description.fn(device_value)  # ✅ 나머지 센서는 실시간 값만 반환
+        device_value = self.coordinator.device.get_value(self.channel_id, self._subkey) or 0 #기기값
+
+        if not (self._is_monthly or self._is_daily):
+            value = device_value  # ✅ 나머지 센서는 실시간 값만 반환
+        else:
+            monthly_stored_value = RefossSensor._cached_monthly_energy_data.get(self.channel_id, 0) #월저장 파일값
+
+            if self._is_daily:
+                daily_stored_value = RefossSensor._cached_daily_energy_data.get(self.channel_id, 0) #일저장 파일값
+                value = device_value + monthly_stored_value - daily_stored_value  # ✅ 일사용량 센서
+            else:
+                value = device_value + monthly_stored_value  # ✅ 월사용량 센서
+
+        if (fn := self._fn) is None:
+            return value
+        return fn(value)